@@ -14,6 +14,9 @@
 """Abstract base class for entrypoint configurations that run a single step."""
 
 import argparse
+import base64
+import functools
+import gzip
 import importlib
 import json
 import logging
@@ -49,6 +52,71 @@ STEP_SOURCE_OPTION = "step_source"
 INPUT_ARTIFACT_SOURCES_OPTION = "input_artifact_sources"
 MATERIALIZER_SOURCES_OPTION = "materializer_sources"
 
+# Pipeline JSON strings larger than this number of characters get compressed
+# before being passed as an entrypoint argument to keep the argument list
+# below the size limits of the OS and container orchestrators.
+PIPELINE_JSON_COMPRESSION_THRESHOLD = 64 * 1024
+# Prefix of compressed pipeline JSON arguments. It can't be confused with a
+# regular base64 encoded argument as `:` is not part of the base64 alphabet.
+COMPRESSED_ARGUMENT_PREFIX = "gz:"
+
+
+def _encode_pipeline_json(pb2_pipeline: Pb2Pipeline) -> str:
+    """Encodes a pipeline so it can be passed as an entrypoint argument.
+
+    Args:
+        pb2_pipeline: The pipeline to encode.
+
+    Returns:
+        The base64 encoded pipeline JSON, gzip compressed and prefixed with
+        `COMPRESSED_ARGUMENT_PREFIX` if it exceeds
+        `PIPELINE_JSON_COMPRESSION_THRESHOLD` characters.
+    """
+    # Orchestrators request the arguments for all steps of a pipeline in a
+    # row, so the (comparatively slow) JSON encoding is cached using the
+    # binary serialization of the pipeline as key.
+    return _encode_serialized_pipeline(
+        pb2_pipeline.SerializeToString(deterministic=True)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _encode_serialized_pipeline(serialized_pipeline: bytes) -> str:
+    """Encodes a binary serialized pipeline as an entrypoint argument.
+
+    Args:
+        serialized_pipeline: The binary serialized pipeline to encode.
+
+    Returns:
+        The encoded pipeline, see `_encode_pipeline_json(...)`.
+    """
+    pb2_pipeline = Pb2Pipeline.FromString(serialized_pipeline)
+    pipeline_json = json_format.MessageToJson(pb2_pipeline)
+    if len(pipeline_json) <= PIPELINE_JSON_COMPRESSION_THRESHOLD:
+        return string_utils.b64_encode(pipeline_json)
+
+    compressed_json = gzip.compress(pipeline_json.encode(), compresslevel=1)
+    encoded_json = base64.b64encode(compressed_json).decode()
+    return COMPRESSED_ARGUMENT_PREFIX + encoded_json
+
+
+def _decode_pipeline_json(argument: str) -> str:
+    """Decodes a pipeline JSON entrypoint argument.
+
+    Args:
+        argument: The argument created by `_encode_pipeline_json(...)`.
+
+    Returns:
+        The pipeline JSON string.
+    """
+    if argument.startswith(COMPRESSED_ARGUMENT_PREFIX):
+        compressed_json = base64.b64decode(
+            argument[len(COMPRESSED_ARGUMENT_PREFIX) :]
+        )
+        return gzip.decompress(compressed_json).decode()
+
+    return string_utils.b64_decode(argument)
+
 
 class StepEntrypointConfiguration(ABC):
     """Abstract base class for entrypoint configurations that run a single step.
@@ -273,6 +341,8 @@ class StepEntrypointConfiguration(ABC):
             # Base64 encoded json representation of the parent pipeline of
             # the step that will be executed. This is needed in order to create
             # the tfx launcher in the entrypoint that will run the ZenML step.
+            # Large pipelines are gzip compressed before encoding and
+            # prefixed with `COMPRESSED_ARGUMENT_PREFIX`.
             PIPELINE_JSON_OPTION,
             # Base64 encoded json dictionary mapping the step input names to
             # importable sources pointing to
@@ -386,7 +456,7 @@ class StepEntrypointConfiguration(ABC):
             # Base64 encode the json strings to make sure there are no issues
             # when passing these arguments
             f"--{PIPELINE_JSON_OPTION}",
-            string_utils.b64_encode(json_format.MessageToJson(pb2_pipeline)),
+            _encode_pipeline_json(pb2_pipeline),
             f"--{INPUT_ARTIFACT_SOURCES_OPTION}",
             string_utils.b64_encode(json.dumps(input_artifact_sources)),
             f"--{MATERIALIZER_SOURCES_OPTION}",
@@ -531,7 +601,7 @@ class StepEntrypointConfiguration(ABC):
         # the step. See `get_entrypoint_options()` for an in-depth explanation
         # of all these arguments.
         pb2_pipeline = Pb2Pipeline()
-        pb2_pipeline_json = string_utils.b64_decode(
+        pb2_pipeline_json = _decode_pipeline_json(
             self.entrypoint_args[PIPELINE_JSON_OPTION]
         )
         json_format.Parse(pb2_pipeline_json, pb2_pipeline)
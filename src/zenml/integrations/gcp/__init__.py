@@ -45,6 +45,7 @@ class GcpIntegration(Integration):
     REQUIREMENTS = [
         "kfp",
         "gcsfs",
+        "google-cloud-storage>=1.32.0,<2",
         "google-cloud-secret-manager",
         "google-cloud-aiplatform>=1.11.0",
     ]
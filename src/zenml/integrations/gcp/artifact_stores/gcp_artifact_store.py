@@ -13,39 +13,345 @@
 #  permissions and limitations under the License.
 """Implementation of the GCP Artifact Store."""
 
+import asyncio
+import functools
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
+    Awaitable,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
+    Pattern,
     Set,
     Tuple,
     Union,
 )
 
+import aiohttp
 import gcsfs
+import google.auth
+from fsspec.asyn import sync
+from google.api_core.exceptions import NotFound, PreconditionFailed
+from google.auth.credentials import Credentials
+from google.auth.exceptions import DefaultCredentialsError
+from google.cloud import storage
+from google.oauth2 import credentials as user_credentials
+from google.oauth2 import service_account
 
 from zenml.artifact_stores import BaseArtifactStore
 from zenml.integrations.gcp import GCP_ARTIFACT_STORE_FLAVOR
 from zenml.secret.schemas import GCPSecretSchema
 from zenml.stack.authentication_mixin import AuthenticationMixin
-from zenml.utils.io_utils import convert_to_str
+from zenml.utils.io_utils import convert_to_str, get_global_config_directory
 
 PathType = Union[bytes, str]
 
+GCS_PATH_PREFIX = "gs://"
+# Maximum number of calls that the GCS JSON API accepts in a single batch
+# request.
+GCS_BATCH_SIZE = 100
+_GLOB_MAGIC_CHARACTERS = re.compile(r"[*?\[]")
+GCS_SCOPE = "https://www.googleapis.com/auth/devstorage.full_control"
+# Total connection limit of aiohttp connectors if not configured otherwise
+AIOHTTP_DEFAULT_CONNECTION_LIMIT = 100
+# Seconds to wait for the connector of a filesystem to close on shutdown
+CONNECTOR_CLOSE_TIMEOUT = 5
+
+
+def _split_gcs_path(path: PathType) -> Tuple[str, str]:
+    """Splits a GCS path into its bucket and object name.
+
+    Args:
+        path: The path to split, with or without the `gs://` prefix.
+
+    Returns:
+        A tuple containing the bucket name and the object name.
+    """
+    path_str = convert_to_str(path)
+    if path_str.startswith(GCS_PATH_PREFIX):
+        path_str = path_str[len(GCS_PATH_PREFIX) :]
+    bucket_name, _, object_name = path_str.partition("/")
+    return bucket_name, object_name
+
+
+def _as_directory_prefix(object_name: str) -> str:
+    """Converts an object name to a prefix matching all objects below it.
+
+    Args:
+        object_name: The object name of a directory.
+
+    Returns:
+        The object name with a trailing slash, or an empty string for the
+        bucket root.
+    """
+    if object_name and not object_name.endswith("/"):
+        return object_name + "/"
+    return object_name
+
+
+def _compile_glob_pattern(pattern: str) -> Pattern[str]:
+    """Compiles a glob pattern for object names to a regular expression.
+
+    Unlike `fnmatch.translate`, wildcards don't match across path components
+    except for `**` as the full name of a path component.
+
+    Args:
+        pattern: The glob pattern to compile.
+
+    Returns:
+        The compiled regular expression which matches the full object name.
+    """
+    regex = ""
+    components = pattern.split("/")
+    for index, component in enumerate(components):
+        is_last_component = index == len(components) - 1
+        if component == "**":
+            # Matches any number of directories, including none
+            regex += ".*" if is_last_component else "(?:[^/]*/)*"
+            continue
+
+        position = 0
+        while position < len(component):
+            char = component[position]
+            closing_bracket = component.find("]", position + 2)
+            if char == "*":
+                regex += "[^/]*"
+            elif char == "?":
+                regex += "[^/]"
+            elif char == "[" and closing_bracket != -1:
+                characters = component[position + 1 : closing_bracket]
+                if characters.startswith("!"):
+                    characters = "^" + characters[1:]
+                characters = characters.replace("\\", "\\\\")
+                regex += "[" + characters.replace("[", "\\[") + "]"
+                position = closing_bracket
+            else:
+                regex += re.escape(char)
+            position += 1
+
+        if not is_last_component:
+            regex += "/"
+
+    return re.compile(regex + r"\Z")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_credentials(
+    token_key: FrozenSet[Tuple[str, Any]]
+) -> Tuple[Optional[Credentials], Optional[str]]:
+    """Loads credentials shared by all stores using the same credential dict.
+
+    Sharing the credentials object means that access tokens are only
+    refreshed once for all artifact stores, filesystems and clients using
+    them, no matter in which thread they are used.
+
+    Args:
+        token_key: The items of the credential dictionary. An empty set means
+            that the default credentials should be used.
+
+    Returns:
+        A tuple containing the credentials and the project associated with
+        them. If no credential dictionary is given and no default credentials
+        are available, the credentials are `None`.
+    """
+    if not token_key:
+        try:
+            credentials, project = google.auth.default(scopes=[GCS_SCOPE])
+        except DefaultCredentialsError:
+            # Let gcsfs fall back to its token cache or anonymous access
+            return None, None
+        return credentials, project
+
+    token = dict(token_key)
+    if token.get("type") == "service_account":
+        credentials = service_account.Credentials.from_service_account_info(
+            token, scopes=[GCS_SCOPE]
+        )
+    else:
+        credentials = user_credentials.Credentials.from_authorized_user_info(
+            token
+        )
+    return credentials, token.get("project_id")
+
+
+async def _create_connector(request_concurrency: int) -> aiohttp.TCPConnector:
+    """Creates a connector for the HTTP session of a gcsfs filesystem.
+
+    This needs to be a coroutine so the connector gets created on the event
+    loop on which the filesystem runs its requests.
+
+    Args:
+        request_concurrency: Maximum number of simultaneous connections to
+            the GCS API host.
+
+    Returns:
+        The connector.
+    """
+    # All requests go to the same host, so the per-host limit is the one that
+    # matters. The total limit is never lowered below the aiohttp default.
+    return aiohttp.TCPConnector(
+        limit=max(AIOHTTP_DEFAULT_CONNECTION_LIMIT, request_concurrency),
+        limit_per_host=request_concurrency,
+    )
+
+
+def _close_connector(
+    loop: asyncio.AbstractEventLoop, connector: aiohttp.TCPConnector, pid: int
+) -> None:
+    """Closes the connector of a shared gcsfs filesystem.
+
+    The HTTP sessions of the filesystem don't own the connector, so it is
+    not closed together with them.
+
+    Args:
+        loop: The event loop on which the connector was created.
+        connector: The connector to close.
+        pid: ID of the process that created the connector.
+    """
+    if os.getpid() != pid or not loop.is_running():
+        # Forked copies of the connector belong to the parent process
+        return
+
+    async def _close() -> None:
+        """Closes the connector on its event loop."""
+        await connector.close()
+
+    sync(loop, _close, timeout=CONNECTOR_CLOSE_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_event_loop(pid: int) -> asyncio.AbstractEventLoop:
+    """Gets an event loop running in a background thread of this process.
+
+    The default fsspec event loop is not reset after forking in all fsspec
+    versions, in which case a forked process would wait forever on the loop
+    of the parent process, whose thread doesn't exist in the fork.
+
+    Args:
+        pid: ID of the process that runs the event loop.
+
+    Returns:
+        The event loop.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever, name="gcsfs-event-loop", daemon=True
+    )
+    thread.start()
+    return loop
+
+
+@functools.lru_cache(maxsize=None)
+def _get_filesystem(
+    credentials: Optional[Credentials], request_concurrency: int, pid: int
+) -> gcsfs.GCSFileSystem:
+    """Gets a gcsfs filesystem shared by all stores using the same credentials.
+
+    Sharing the filesystem between artifact store instances allows them to
+    reuse the same HTTP session and access token instead of setting up new
+    connections and authenticating again for every instance.
+
+    Args:
+        credentials: The credentials used to authenticate the filesystem. If
+            `None`, gcsfs looks up credentials itself.
+        request_concurrency: Maximum number of simultaneous connections of
+            the HTTP session of the filesystem.
+        pid: ID of the process that uses the filesystem. The event loop and
+            HTTP session of a filesystem can't be used after forking, so
+            forked processes need to create their own filesystem.
+
+    Returns:
+        The gcsfs filesystem for the given credentials.
+    """
+    loop = _get_event_loop(pid)
+    connector = sync(loop, _create_connector, request_concurrency)
+    # The connector must outlive the session so gcsfs can open a new session
+    # with the same connector after closing the previous one.
+    session_kwargs = {"connector": connector, "connector_owner": False}
+    filesystem = gcsfs.GCSFileSystem(
+        token=credentials, loop=loop, session_kwargs=session_kwargs
+    )
+    weakref.finalize(filesystem, _close_connector, loop, connector, pid)
+    return filesystem
+
 
 class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
-    """Artifact Store for Google Cloud Storage based artifacts."""
+    """Artifact Store for Google Cloud Storage based artifacts.
 
-    _filesystem: Optional[gcsfs.GCSFileSystem] = None
+    Simple file operations are delegated to `gcsfs`, while operations that
+    touch many objects at once (recursive deletes, listings and server-side
+    copies) go through the native `google-cloud-storage` client.
+
+    Attributes:
+        use_local_cache: If `True`, files opened for binary reading are
+            downloaded once into a local cache directory and read from disk
+            afterwards. Cached files are keyed by the object generation, so
+            overwritten objects are downloaded again.
+        local_cache_dir: Directory in which to store cached files. If not
+            provided, a subdirectory of the global ZenML config directory will
+            be used.
+        max_workers: Maximum number of threads used to issue requests
+            concurrently for bulk operations. If not provided, four threads
+            per CPU (but at most 32) will be used.
+        request_concurrency: Maximum number of requests that gcsfs sends to
+            GCS at the same time, both as the number of connections to the
+            GCS API host and for concurrent metadata lookups. Defaults to
+            128, which is above the 100 connections that gcsfs would use by
+            default. When raising `max_workers`, this should usually be
+            raised as well.
+    """
+
+    use_local_cache: bool = False
+    local_cache_dir: Optional[str] = None
+    max_workers: Optional[int] = None
+    request_concurrency: int = 128
+    _client: Optional[storage.Client] = None
+    _credentials: Optional[Credentials] = None
+    _project: Optional[str] = None
 
     # Class Configuration
     FLAVOR: ClassVar[str] = GCP_ARTIFACT_STORE_FLAVOR
     SUPPORTED_SCHEMES: ClassVar[Set[str]] = {"gs://"}
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Gets the state of the artifact store for pickling.
+
+        The client and credentials are excluded so that unpickled copies
+        reuse the shared credentials instead of authenticating again.
+
+        Returns:
+            The state of the artifact store.
+        """
+        state: Dict[str, Any] = super().__getstate__()
+        state["__private_attribute_values__"] = {
+            key: value
+            for key, value in state["__private_attribute_values__"].items()
+            if key not in ("_client", "_credentials")
+        }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores the state of the artifact store after unpickling.
+
+        Args:
+            state: The pickled state of the artifact store.
+        """
+        # Initialize the private attributes excluded from pickling to their
+        # defaults before restoring the remaining state.
+        self._init_private_attributes()
+        super().__setstate__(state)
+
     @property
     def filesystem(self) -> gcsfs.GCSFileSystem:
         """The gcsfs filesystem to access this artifact store.
@@ -53,14 +359,184 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
         Returns:
             The gcsfs filesystem to access this artifact store.
         """
-        if not self._filesystem:
+        # Not stored on the instance so that artifact stores used in a
+        # forked process pick up a filesystem created in that process.
+        credentials, _ = self._get_credentials()
+        return _get_filesystem(
+            credentials, self.request_concurrency, os.getpid()
+        )
+
+    def _get_credentials(self) -> Tuple[Optional[Credentials], Optional[str]]:
+        """Gets the credentials and project used to access GCS.
+
+        The credentials are created once and shared by the filesystem and
+        all clients of this artifact store, as well as by other artifact
+        stores using the same authentication secret.
+
+        Returns:
+            A tuple containing the credentials and the project associated
+            with them. The credentials are `None` if no authentication secret
+            is configured and no default credentials are available.
+        """
+        if not self._credentials:
             secret = self.get_authentication_secret(
                 expected_schema_type=GCPSecretSchema
             )
-            token = secret.get_credential_dict() if secret else None
-            self._filesystem = gcsfs.GCSFileSystem(token=token)
+            token_key = frozenset(
+                (secret.get_credential_dict() if secret else {}).items()
+            )
+            self._credentials, self._project = _load_credentials(token_key)
+
+        return self._credentials, self._project
+
+    def _create_client(self) -> storage.Client:
+        """Creates a new google-cloud-storage client.
+
+        Returns:
+            A new google-cloud-storage client.
+        """
+        credentials, project = self._get_credentials()
+        if credentials is None:
+            return storage.Client.create_anonymous_client()
+        return storage.Client(project=project, credentials=credentials)
+
+    @property
+    def client(self) -> storage.Client:
+        """The google-cloud-storage client to access this artifact store.
+
+        Returns:
+            The google-cloud-storage client to access this artifact store.
+        """
+        if not self._client:
+            self._client = self._create_client()
+
+        return self._client
+
+    @property
+    def worker_count(self) -> int:
+        """Number of threads used to issue requests for bulk operations.
+
+        Returns:
+            The number of threads used to issue requests for bulk operations.
+        """
+        return self.max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def _run_concurrently(
+        self,
+        coroutine_function: Callable[[str], Awaitable[Any]],
+        paths: List[PathType],
+    ) -> Dict[PathType, Any]:
+        """Runs a gcsfs coroutine function concurrently for multiple paths.
+
+        The coroutines are run on the event loop of the gcsfs filesystem with
+        at most `request_concurrency` requests in flight, so N
+        requests take about as long as the slowest of them instead of the
+        sum of all of them.
+
+        Args:
+            coroutine_function: The coroutine function to call for each path.
+                It receives the path converted to a string.
+            paths: The paths to call the coroutine function for.
+
+        Returns:
+            A dictionary mapping each of the original paths to the result of
+            the coroutine.
+        """
+
+        async def _gather() -> List[Any]:
+            """Awaits the coroutines for all paths.
+
+            Returns:
+                The results of the coroutines in the order of the paths.
+            """
+            semaphore = asyncio.Semaphore(self.request_concurrency)
+
+            async def _run(path: PathType) -> Any:
+                """Awaits the coroutine for a single path.
+
+                Args:
+                    path: The path to call the coroutine function for.
+
+                Returns:
+                    The result of the coroutine.
+                """
+                async with semaphore:
+                    return await coroutine_function(convert_to_str(path))
+
+            results: List[Any] = await asyncio.gather(
+                *(_run(path) for path in paths)
+            )
+            return results
+
+        results = sync(self.filesystem.loop, _gather)
+        return dict(zip(paths, results))
+
+    @property
+    def local_cache_directory(self) -> str:
+        """Path to the local directory in which cached files are stored.
+
+        Returns:
+            The path to the local cache directory.
+        """
+        return self.local_cache_dir or os.path.join(
+            get_global_config_directory(),
+            "gcp_artifact_store_cache",
+            str(self.uuid),
+        )
+
+    def _get_cached_file(self, path: PathType) -> str:
+        """Gets the path of a local copy of a file in the artifact store.
+
+        The file is downloaded into the local cache directory if no copy of
+        its current generation exists yet, in which case copies of older
+        generations of the file are removed from the cache.
+
+        Args:
+            path: Path of the file in the artifact store.
+
+        Returns:
+            The path of the local copy of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        bucket_name, object_name = _split_gcs_path(path)
+        blob = self.client.bucket(bucket_name).get_blob(object_name)
+        if blob is None:
+            raise FileNotFoundError(
+                f"File '{convert_to_str(path)}' does not exist."
+            )
+
+        path_key = hashlib.sha256(convert_to_str(path).encode()).hexdigest()
+        cache_name = f"{path_key}-{blob.generation}"
+        cache_path = os.path.join(self.local_cache_directory, cache_name)
+        if not os.path.exists(cache_path):
+            os.makedirs(self.local_cache_directory, exist_ok=True)
+            # Download into a temporary file first so concurrent readers
+            # never see a partially downloaded file.
+            fd, temp_path = tempfile.mkstemp(dir=self.local_cache_directory)
+            os.close(fd)
+            try:
+                blob.download_to_filename(temp_path)
+                os.replace(temp_path, cache_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
 
-        return self._filesystem
+            superseded_copies = [
+                os.path.join(self.local_cache_directory, file_name)
+                for file_name in os.listdir(self.local_cache_directory)
+                if file_name.startswith(f"{path_key}-")
+                and file_name != cache_name
+            ]
+            for superseded_copy in superseded_copies:
+                try:
+                    os.remove(superseded_copy)
+                except FileNotFoundError:
+                    # Already removed by a concurrent reader
+                    pass
+
+        return cache_path
 
     def open(self, path: PathType, mode: str = "r") -> Any:
         """Open a file at the given path.
@@ -73,8 +549,58 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
         Returns:
             A file-like object that can be used to read or write to the file.
         """
+        if self.use_local_cache and mode == "rb":
+            return open(self._get_cached_file(path), mode)
+
         return self.filesystem.open(path=path, mode=mode)
 
+    def _copy_blob(
+        self, src: PathType, dst: PathType, overwrite: bool
+    ) -> storage.Blob:
+        """Copies a blob server-side.
+
+        If overwrite is not set, the copy is made conditional on the
+        destination not existing yet (`ifGenerationMatch=0`), which saves a
+        separate existence check.
+
+        Args:
+            src: The path to copy from.
+            dst: The path to copy to.
+            overwrite: Whether to overwrite an existing destination blob.
+
+        Returns:
+            The source blob.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+        """
+        src_bucket_name, src_name = _split_gcs_path(src)
+        dst_bucket_name, dst_name = _split_gcs_path(dst)
+        src_blob = self.client.bucket(src_bucket_name).blob(src_name)
+        dst_blob = self.client.bucket(dst_bucket_name).blob(dst_name)
+        if_generation_match = None if overwrite else 0
+
+        # Server-side copy; large objects or copies across locations and
+        # storage classes might need multiple rewrite calls to complete.
+        try:
+            rewrite_token, _, _ = dst_blob.rewrite(
+                src_blob, if_generation_match=if_generation_match
+            )
+            while rewrite_token is not None:
+                rewrite_token, _, _ = dst_blob.rewrite(
+                    src_blob,
+                    token=rewrite_token,
+                    if_generation_match=if_generation_match,
+                )
+        except NotFound as e:
+            raise FileNotFoundError(
+                f"Unable to copy '{convert_to_str(src)}', file does not exist."
+            ) from e
+        finally:
+            self.filesystem.invalidate_cache(convert_to_str(dst))
+
+        return src_blob
+
     def copyfile(
         self, src: PathType, dst: PathType, overwrite: bool = False
     ) -> None:
@@ -91,14 +617,13 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
             FileExistsError: If a file already exists at the destination
                 and overwrite is not set to `True`.
         """
-        if not overwrite and self.filesystem.exists(dst):
+        try:
+            self._copy_blob(src=src, dst=dst, overwrite=overwrite)
+        except PreconditionFailed as e:
             raise FileExistsError(
                 f"Unable to copy to destination '{convert_to_str(dst)}', "
                 f"file already exists. Set `overwrite=True` to copy anyway."
-            )
-        # TODO [ENG-151]: Check if it works with overwrite=True or if we need to
-        #  manually remove it first
-        self.filesystem.copy(path1=src, path2=dst)
+            ) from e
 
     def exists(self, path: PathType) -> bool:
         """Check whether a path exists.
@@ -111,6 +636,39 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
         """
         return self.filesystem.exists(path=path)  # type: ignore[no-any-return]
 
+    def exists_many(self, paths: List[PathType]) -> Dict[PathType, bool]:
+        """Check whether multiple paths exist.
+
+        The lookups are sent concurrently instead of one after the other, so
+        checking N paths takes about as long as the slowest lookup. Like for
+        `exists`, paths that can't be accessed (e.g. because their bucket
+        doesn't exist) are reported as not existing.
+
+        Args:
+            paths: The paths to check.
+
+        Returns:
+            A dictionary mapping each path to whether it exists.
+        """
+        filesystem = self.filesystem
+
+        async def _exists(path: str) -> bool:
+            """Checks whether a single path exists.
+
+            Args:
+                path: The path to check.
+
+            Returns:
+                True if the path exists, False otherwise.
+            """
+            try:
+                exists: bool = await filesystem._exists(path)
+            except OSError:
+                return False
+            return exists
+
+        return self._run_concurrently(_exists, paths)
+
     def glob(self, pattern: PathType) -> List[PathType]:
         """Return all paths that match the given glob pattern.
 
@@ -121,13 +679,120 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
         - '**' as the full name of a path component to match to search
           in subdirectories of any depth (e.g. '/some_dir/**/some_file)
 
+        Patterns containing '**' are matched against a single paged
+        `list_blobs` call of all objects starting with the static part of the
+        pattern. All other patterns are matched one path component at a time
+        using delimited listings, which only return a single directory level
+        instead of the whole subtree.
+
         Args:
             pattern: The glob pattern to match, see details above.
 
         Returns:
             A list of paths that match the given glob pattern.
         """
-        return self.filesystem.glob(path=pattern)  # type: ignore[no-any-return]
+        bucket_name, object_pattern = _split_gcs_path(pattern)
+        if _GLOB_MAGIC_CHARACTERS.search(bucket_name):
+            # Wildcards in bucket names require listing the buckets
+            return [
+                f"{GCS_PATH_PREFIX}{path}"
+                for path in self.filesystem.glob(path=pattern)
+            ]
+
+        if "**" in object_pattern.split("/"):
+            matches = self._glob_recursive(bucket_name, object_pattern)
+        else:
+            matches = self._glob_by_level(bucket_name, object_pattern)
+
+        return [
+            f"{GCS_PATH_PREFIX}{bucket_name}/{object_name}"
+            for object_name in sorted(matches)
+        ]
+
+    def _glob_recursive(
+        self, bucket_name: str, object_pattern: str
+    ) -> Set[str]:
+        """Matches a glob pattern against a listing of all objects below it.
+
+        Args:
+            bucket_name: Name of the bucket to search.
+            object_pattern: The glob pattern for object names.
+
+        Returns:
+            The object names of all matching files and directories.
+        """
+        static_prefix = _GLOB_MAGIC_CHARACTERS.split(object_pattern, 1)[0]
+        regex = _compile_glob_pattern(object_pattern)
+
+        matches: Set[str] = set()
+        for blob in self.client.list_blobs(bucket_name, prefix=static_prefix):
+            # Directories only exist implicitly as part of object names, so
+            # all parent directories of an object are candidates as well
+            object_name = blob.name.rstrip("/")
+            candidate = object_name
+            while len(candidate) >= len(static_prefix):
+                if candidate not in matches and regex.match(candidate):
+                    matches.add(candidate)
+                if "/" not in candidate:
+                    break
+                candidate = candidate.rsplit("/", 1)[0]
+
+        return matches
+
+    def _glob_by_level(self, bucket_name: str, object_pattern: str) -> Set[str]:
+        """Matches a glob pattern one directory level at a time.
+
+        Args:
+            bucket_name: Name of the bucket to search.
+            object_pattern: The glob pattern for object names, which must not
+                contain '**' as a path component.
+
+        Returns:
+            The object names of all matching files and directories.
+        """
+        static_prefix = _GLOB_MAGIC_CHARACTERS.split(object_pattern, 1)[0]
+        static_directory = static_prefix[: static_prefix.rfind("/") + 1]
+        components = object_pattern[len(static_directory) :].split("/")
+
+        matches: Set[str] = set()
+        directories = [static_directory]
+        for index, component in enumerate(components):
+            regex = _compile_glob_pattern(component)
+            component_prefix = _GLOB_MAGIC_CHARACTERS.split(component, 1)[0]
+            is_last_component = index == len(components) - 1
+
+            subdirectories: List[str] = []
+            for directory in directories:
+                iterator = self.client.list_blobs(
+                    bucket_name,
+                    prefix=directory + component_prefix,
+                    delimiter="/",
+                )
+                names = [blob.name[len(directory) :] for blob in iterator]
+                # Subdirectory prefixes are only populated after consuming
+                # all pages
+                subdirectory_names = [
+                    subdirectory[len(directory) :].rstrip("/")
+                    for subdirectory in iterator.prefixes
+                ]
+
+                if is_last_component:
+                    names += subdirectory_names
+                    matches.update(
+                        directory + name
+                        for name in names
+                        if name and regex.match(name)
+                    )
+                else:
+                    subdirectories.extend(
+                        f"{directory}{name}/"
+                        for name in subdirectory_names
+                        if regex.match(name)
+                    )
+
+            directories = subdirectories
+
+        return matches
 
     def isdir(self, path: PathType) -> bool:
         """Check whether a path is a directory.
@@ -140,16 +805,58 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
         """
         return self.filesystem.isdir(path=path)  # type: ignore[no-any-return]
 
+    def isdir_many(self, paths: List[PathType]) -> Dict[PathType, bool]:
+        """Check whether multiple paths are directories.
+
+        Args:
+            paths: The paths to check.
+
+        Returns:
+            A dictionary mapping each path to whether it is a directory.
+        """
+        return self._run_concurrently(self.filesystem._isdir, paths)
+
     def listdir(self, path: PathType) -> List[PathType]:
         """Return a list of files in a directory.
 
+        The directory is listed with a single delimited `list_blobs` call
+        which returns files and subdirectories without any per-entry metadata
+        requests.
+
         Args:
             path: The path of the directory to list.
 
         Returns:
-            A list of paths of files in the directory.
+            A list of the names of files and directories in the directory.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
         """
-        return self.filesystem.listdir(path=path)  # type: ignore[no-any-return]
+        bucket_name, object_name = _split_gcs_path(path)
+        prefix = _as_directory_prefix(object_name)
+        iterator = self.client.list_blobs(
+            bucket_name, prefix=prefix, delimiter="/"
+        )
+
+        found = False
+        entries: List[PathType] = []
+        for blob in iterator:
+            found = True
+            # Skip the placeholder object that marks the directory itself
+            if blob.name != prefix:
+                entries.append(blob.name[len(prefix) :])
+
+        # Subdirectory prefixes are only populated after consuming all pages
+        for subdirectory in iterator.prefixes:
+            found = True
+            entries.append(subdirectory[len(prefix) :].rstrip("/"))
+
+        if not found and prefix:
+            raise FileNotFoundError(
+                f"Directory '{convert_to_str(path)}' does not exist."
+            )
+
+        return entries
 
     def makedirs(self, path: PathType) -> None:
         """Create a directory at the given path.
@@ -193,23 +900,71 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
             FileExistsError: If a file already exists at the destination
                 and overwrite is not set to `True`.
         """
-        if not overwrite and self.filesystem.exists(dst):
+        try:
+            src_blob = self._copy_blob(src=src, dst=dst, overwrite=overwrite)
+        except PreconditionFailed as e:
             raise FileExistsError(
                 f"Unable to rename file to '{convert_to_str(dst)}', "
                 f"file already exists. Set `overwrite=True` to rename anyway."
-            )
+            ) from e
 
-        # TODO [ENG-152]: Check if it works with overwrite=True or if we need
-        #  to manually remove it first
-        self.filesystem.rename(path1=src, path2=dst)
+        src_blob.delete()
+        self.filesystem.invalidate_cache(convert_to_str(src))
 
     def rmtree(self, path: PathType) -> None:
         """Remove the given directory.
 
+        All objects below the directory are listed once and then deleted
+        using batched requests of up to `GCS_BATCH_SIZE` deletions each.
+        The batched requests are sent concurrently by up to `worker_count`
+        threads.
+
         Args:
             path: The path of the directory to remove.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
         """
-        self.filesystem.delete(path=path, recursive=True)
+        bucket_name, object_name = _split_gcs_path(path)
+        blobs = list(
+            self.client.list_blobs(
+                bucket_name, prefix=_as_directory_prefix(object_name)
+            )
+        )
+        if not blobs:
+            raise FileNotFoundError(
+                f"Directory '{convert_to_str(path)}' does not exist."
+            )
+
+        # Clients keep track of the active batch, which means batches can't
+        # be sent concurrently using the same client. Each worker thread
+        # creates one client and reuses it for all of its batches.
+        thread_clients = threading.local()
+
+        def _delete_batch(batch: List[storage.Blob]) -> None:
+            """Deletes a batch of blobs with a single request.
+
+            Args:
+                batch: The blobs to delete.
+            """
+            client = getattr(thread_clients, "client", None)
+            if client is None:
+                client = thread_clients.client = self._create_client()
+
+            with client.batch():
+                for blob in batch:
+                    blob.delete(client=client)
+
+        batches = [
+            blobs[start : start + GCS_BATCH_SIZE]
+            for start in range(0, len(blobs), GCS_BATCH_SIZE)
+        ]
+        max_workers = min(self.worker_count, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results to propagate any exceptions
+            list(executor.map(_delete_batch, batches))
+
+        self.filesystem.invalidate_cache(convert_to_str(path))
 
     def stat(self, path: PathType) -> Dict[str, Any]:
         """Return stat info for the given path.
@@ -222,6 +977,34 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
         """
         return self.filesystem.stat(path=path)  # type: ignore[no-any-return]
 
+    def stat_many(
+        self, paths: List[PathType]
+    ) -> Dict[PathType, Dict[str, Any]]:
+        """Return stat info for multiple paths.
+
+        Args:
+            paths: The paths to get stat info for.
+
+        Returns:
+            A dictionary mapping each path to its stat info.
+        """
+        return self._run_concurrently(self.filesystem._info, paths)
+
+    def statall(self, path: PathType) -> List[Dict[str, Any]]:
+        """Return stat info for all files and directories in a directory.
+
+        Unlike calling `stat` for every entry returned by `listdir`, this
+        retrieves the stat info of all entries with a single listing.
+
+        Args:
+            path: The path of the directory.
+
+        Returns:
+            A list of dictionaries with the stat info of all entries in the
+            directory.
+        """
+        return self.filesystem.ls(path=path, detail=True)  # type: ignore[no-any-return]
+
     def walk(
         self,
         top: PathType,
@@ -230,15 +1013,71 @@ class GCPArtifactStore(BaseArtifactStore, AuthenticationMixin):
     ) -> Iterable[Tuple[PathType, List[PathType], List[PathType]]]:
         """Return an iterator that walks the contents of the given directory.
 
+        All objects below the directory are listed with a single paged
+        `list_blobs` call and the directory tree is rebuilt from their names,
+        instead of listing every subdirectory separately.
+
         Args:
             top: Path of directory to walk.
-            topdown: Unused argument to conform to interface.
+            topdown: Whether to walk directories topdown or bottom-up.
             onerror: Unused argument to conform to interface.
 
-        Returns:
+        Yields:
             An Iterable of Tuples, each of which contain the path of the current
             directory path, a list of directories inside the current directory
             and a list of files inside the current directory.
         """
-        # TODO [ENG-153]: Additional params
-        return self.filesystem.walk(path=top)  # type: ignore[no-any-return]
+        bucket_name, object_name = _split_gcs_path(top)
+        prefix = _as_directory_prefix(object_name)
+        root = prefix.rstrip("/")
+
+        # Maps the object names of all directories to their subdirectory and
+        # file names
+        tree: Dict[str, Tuple[Set[str], List[str]]] = {}
+        for blob in self.client.list_blobs(bucket_name, prefix=prefix):
+            directory = root
+            *directory_names, file_name = blob.name[len(prefix) :].split("/")
+            for directory_name in directory_names:
+                tree.setdefault(directory, (set(), []))[0].add(directory_name)
+                directory = f"{directory}/{directory_name}".lstrip("/")
+
+            # Directories without any files only exist as placeholder objects
+            # with an empty file name, but still need to be part of the tree
+            files = tree.setdefault(directory, (set(), []))[1]
+            if file_name:
+                files.append(file_name)
+
+        if not tree:
+            return
+
+        def _walk(
+            directory: str,
+        ) -> Iterable[Tuple[PathType, List[PathType], List[PathType]]]:
+            """Walks the directory tree starting at the given directory.
+
+            Args:
+                directory: Object name of the directory to start at.
+
+            Yields:
+                The path, subdirectories and files of all directories in the
+                tree.
+            """
+            subdirectories, files = tree[directory]
+            path = f"{GCS_PATH_PREFIX}{bucket_name}/{directory}".rstrip("/")
+            subdirectory_names: List[PathType] = sorted(subdirectories)
+            file_names: List[PathType] = sorted(files)
+
+            if topdown:
+                yield path, subdirectory_names, file_names
+
+            # Iterate over the yielded list so callers can prune the walk by
+            # modifying it in place, like with `os.walk`
+            for subdirectory in subdirectory_names:
+                yield from _walk(
+                    f"{directory}/{convert_to_str(subdirectory)}".lstrip("/")
+                )
+
+            if not topdown:
+                yield path, subdirectory_names, file_names
+
+        yield from _walk(root)
@@ -379,17 +379,22 @@ class VertexOrchestrator(BaseOrchestrator, GoogleCredentialsMixin):
             """
             step_name_to_container_op: Dict[str, dsl.ContainerOp] = {}
 
-            for step in sorted_steps:
-                # The command will be needed to eventually call the python step
-                # within the docker container
-                command = VertexEntrypointConfiguration.get_entrypoint_command()
+            # The command will be needed to eventually call the python step
+            # within the docker container. It is the same for all steps.
+            command = VertexEntrypointConfiguration.get_entrypoint_command()
+            custom_arguments = {
+                VERTEX_JOB_ID_OPTION: dslv2.PIPELINE_JOB_ID_PLACEHOLDER
+            }
 
+            for step in sorted_steps:
                 # The arguments are passed to configure the entrypoint of the
                 # docker container when the step is called.
-                arguments = VertexEntrypointConfiguration.get_entrypoint_arguments(
-                    step=step,
-                    pb2_pipeline=pb2_pipeline,
-                    **{VERTEX_JOB_ID_OPTION: dslv2.PIPELINE_JOB_ID_PLACEHOLDER},
+                arguments = (
+                    VertexEntrypointConfiguration.get_entrypoint_arguments(
+                        step=step,
+                        pb2_pipeline=pb2_pipeline,
+                        **custom_arguments,
+                    )
                 )
 
                 # Create the `ContainerOp` for the step. Using the
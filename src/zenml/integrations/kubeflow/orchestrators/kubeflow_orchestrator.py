@@ -616,21 +616,20 @@ class KubeflowOrchestrator(BaseOrchestrator):
             # Dictionary of container_ops index by the associated step name
             step_name_to_container_op: Dict[str, dsl.ContainerOp] = {}
 
-            for step in sorted_steps:
-                # The command will be needed to eventually call the python step
-                # within the docker container
-                command = (
-                    KubeflowEntrypointConfiguration.get_entrypoint_command()
-                )
+            # The command will be needed to eventually call the python step
+            # within the docker container. It is the same for all steps.
+            command = KubeflowEntrypointConfiguration.get_entrypoint_command()
+            metadata_ui_path = "/outputs/mlpipeline-ui-metadata.json"
+            custom_arguments = {METADATA_UI_PATH_OPTION: metadata_ui_path}
 
+            for step in sorted_steps:
                 # The arguments are passed to configure the entrypoint of the
                 # docker container when the step is called.
-                metadata_ui_path = "/outputs/mlpipeline-ui-metadata.json"
                 arguments = (
                     KubeflowEntrypointConfiguration.get_entrypoint_arguments(
                         step=step,
                         pb2_pipeline=pb2_pipeline,
-                        **{METADATA_UI_PATH_OPTION: metadata_ui_path},
+                        **custom_arguments,
                     )
                 )
 
@@ -0,0 +1,74 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from google.protobuf import json_format
+from tfx.proto.orchestration.pipeline_pb2 import Pipeline as Pb2Pipeline
+
+from zenml.entrypoints.step_entrypoint_configuration import (
+    COMPRESSED_ARGUMENT_PREFIX,
+    PIPELINE_JSON_COMPRESSION_THRESHOLD,
+    _decode_pipeline_json,
+    _encode_pipeline_json,
+)
+
+
+def _create_pipeline(pipeline_name: str) -> Pb2Pipeline:
+    """Creates a pipeline proto with the given name."""
+    pb2_pipeline = Pb2Pipeline()
+    pb2_pipeline.pipeline_info.id = pipeline_name
+    return pb2_pipeline
+
+
+def test_small_pipeline_json_is_not_compressed():
+    """Tests that pipelines below the compression threshold are only base64
+    encoded and decode to the original pipeline JSON."""
+    pb2_pipeline = _create_pipeline("small_pipeline")
+    pipeline_json = json_format.MessageToJson(pb2_pipeline)
+    assert len(pipeline_json) <= PIPELINE_JSON_COMPRESSION_THRESHOLD
+
+    argument = _encode_pipeline_json(pb2_pipeline)
+
+    assert not argument.startswith(COMPRESSED_ARGUMENT_PREFIX)
+    assert _decode_pipeline_json(argument) == pipeline_json
+
+
+def test_large_pipeline_json_is_compressed():
+    """Tests that pipelines above the compression threshold are compressed
+    and decode to the original pipeline JSON."""
+    pb2_pipeline = _create_pipeline(
+        "large_pipeline" * PIPELINE_JSON_COMPRESSION_THRESHOLD
+    )
+    pipeline_json = json_format.MessageToJson(pb2_pipeline)
+    assert len(pipeline_json) > PIPELINE_JSON_COMPRESSION_THRESHOLD
+
+    argument = _encode_pipeline_json(pb2_pipeline)
+
+    assert argument.startswith(COMPRESSED_ARGUMENT_PREFIX)
+    assert len(argument) < len(pipeline_json)
+    assert _decode_pipeline_json(argument) == pipeline_json
+
+
+def test_encoding_of_changed_pipeline_is_not_cached():
+    """Tests that the cached encoding is not returned after the pipeline
+    changed."""
+    pb2_pipeline = _create_pipeline("pipeline")
+    argument = _encode_pipeline_json(pb2_pipeline)
+    assert _encode_pipeline_json(pb2_pipeline) == argument
+
+    pb2_pipeline.pipeline_info.id = "changed_pipeline"
+    changed_argument = _encode_pipeline_json(pb2_pipeline)
+
+    changed_json = json_format.MessageToJson(pb2_pipeline)
+    assert changed_argument != argument
+    assert _decode_pipeline_json(changed_argument) == changed_json
@@ -12,13 +12,26 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import asyncio
+import os
+import pickle
+from types import SimpleNamespace
 
+import aiohttp
 import pytest
+from fsspec.asyn import get_loop, sync
+from google.api_core.exceptions import PreconditionFailed
+from google.auth.exceptions import DefaultCredentialsError
 
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.integrations.gcp.artifact_stores.gcp_artifact_store import (
     GCPArtifactStore,
+    _close_connector,
+    _create_connector,
+    _get_event_loop,
+    _get_filesystem,
+    _load_credentials,
 )
 
 
@@ -41,3 +54,444 @@ def test_must_be_gcs_path():
 
     artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
     assert artifact_store.path == "gs://mybucket"
+
+
+def test_listdir_uses_single_delimited_listing(mocker):
+    """Tests that listing a directory returns the names of files and
+    subdirectories from a single delimited `list_blobs` call."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    iterator = mocker.MagicMock()
+    iterator.__iter__.return_value = iter(
+        [SimpleNamespace(name="dir/"), SimpleNamespace(name="dir/file.txt")]
+    )
+    iterator.prefixes = {"dir/subdir/"}
+    client = mocker.MagicMock()
+    client.list_blobs.return_value = iterator
+    artifact_store._client = client
+
+    assert artifact_store.listdir("gs://mybucket/dir") == ["file.txt", "subdir"]
+    client.list_blobs.assert_called_once_with(
+        "mybucket", prefix="dir/", delimiter="/"
+    )
+
+
+def test_rmtree_deletes_in_batches(mocker):
+    """Tests that removing a directory deletes all objects in batches of at
+    most 100 requests."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    blobs = [mocker.MagicMock() for _ in range(250)]
+    client = mocker.MagicMock()
+    client.list_blobs.return_value = iter(blobs)
+    mocker.patch.object(GCPArtifactStore, "_create_client", return_value=client)
+    mocker.patch.object(
+        GCPArtifactStore, "filesystem", new_callable=mocker.PropertyMock
+    )
+
+    artifact_store.rmtree("gs://mybucket/dir")
+
+    client.list_blobs.assert_called_once_with("mybucket", prefix="dir/")
+    assert client.batch.call_count == 3
+    assert all(blob.delete.call_count == 1 for blob in blobs)
+
+
+def test_rmtree_reuses_one_client_per_worker(mocker):
+    """Tests that removing a directory creates at most one client per worker
+    thread instead of one client per batch."""
+    artifact_store = GCPArtifactStore(
+        name="", path="gs://mybucket", max_workers=2
+    )
+
+    artifact_store._client = mocker.MagicMock()
+    artifact_store._client.list_blobs.return_value = iter(
+        [mocker.MagicMock() for _ in range(1000)]
+    )
+    client = mocker.MagicMock()
+    create_client = mocker.patch.object(
+        GCPArtifactStore, "_create_client", return_value=client
+    )
+    mocker.patch.object(
+        GCPArtifactStore, "filesystem", new_callable=mocker.PropertyMock
+    )
+
+    artifact_store.rmtree("gs://mybucket/dir")
+
+    assert client.batch.call_count == 10
+    assert create_client.call_count <= 2
+
+
+def test_pickling_drops_filesystem_and_client(mocker):
+    """Tests that pickled gcp artifact stores don't include the filesystem or
+    client and reuse the shared filesystem after unpickling."""
+    mocker.patch(
+        "zenml.integrations.gcp.artifact_stores.gcp_artifact_store.gcsfs"
+    )
+    mocker.patch(
+        "zenml.integrations.gcp.artifact_stores.gcp_artifact_store"
+        "._load_credentials",
+        return_value=(mocker.MagicMock(), None),
+    )
+    _get_filesystem.cache_clear()
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+    filesystem = artifact_store.filesystem
+    artifact_store._client = "client"
+
+    unpickled_store = pickle.loads(pickle.dumps(artifact_store))
+
+    assert unpickled_store._client is None
+    assert unpickled_store.path == "gs://mybucket"
+    assert unpickled_store.filesystem is filesystem
+
+
+def test_forked_processes_create_their_own_filesystem(mocker):
+    """Tests that the shared filesystem is not reused after forking, as its
+    event loop and HTTP session belong to the parent process."""
+    gcsfs = mocker.patch(
+        "zenml.integrations.gcp.artifact_stores.gcp_artifact_store.gcsfs"
+    )
+    mocker.patch(
+        "zenml.integrations.gcp.artifact_stores.gcp_artifact_store"
+        "._load_credentials",
+        return_value=(mocker.MagicMock(), None),
+    )
+    gcsfs.GCSFileSystem.side_effect = lambda **kwargs: mocker.MagicMock()
+    getpid = mocker.patch(
+        "zenml.integrations.gcp.artifact_stores.gcp_artifact_store.os.getpid",
+        return_value=1,
+    )
+    _get_filesystem.cache_clear()
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+    parent_filesystem = artifact_store.filesystem
+    assert artifact_store.filesystem is parent_filesystem
+
+    getpid.return_value = 2
+    assert artifact_store.filesystem is not parent_filesystem
+    assert gcsfs.GCSFileSystem.call_count == 2
+    parent_call, child_call = gcsfs.GCSFileSystem.call_args_list
+    # The forked process runs its requests on its own event loop
+    assert parent_call[1]["loop"] is not child_call[1]["loop"]
+
+
+def test_missing_default_credentials_fall_back_to_gcsfs_lookup(mocker):
+    """Tests that stores without authentication secret still work if no
+    default credentials are available."""
+    module = "zenml.integrations.gcp.artifact_stores.gcp_artifact_store"
+    gcsfs = mocker.patch(f"{module}.gcsfs")
+    mocker.patch(
+        f"{module}.google.auth.default",
+        side_effect=DefaultCredentialsError("no credentials"),
+    )
+    storage = mocker.patch(f"{module}.storage")
+    _load_credentials.cache_clear()
+    _get_filesystem.cache_clear()
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    assert artifact_store.filesystem is gcsfs.GCSFileSystem.return_value
+    assert gcsfs.GCSFileSystem.call_args[1]["token"] is None
+    assert artifact_store.client is (
+        storage.Client.create_anonymous_client.return_value
+    )
+    _load_credentials.cache_clear()
+
+
+def test_request_concurrency_limits_connections(mocker):
+    """Tests that the request concurrency configures the connection pool of
+    the shared filesystem, which doesn't get closed together with a
+    session."""
+    gcsfs = mocker.patch(
+        "zenml.integrations.gcp.artifact_stores.gcp_artifact_store.gcsfs"
+    )
+    _get_filesystem.cache_clear()
+
+    _get_filesystem(mocker.MagicMock(), 5, 1)
+
+    session_kwargs = gcsfs.GCSFileSystem.call_args[1]["session_kwargs"]
+    assert isinstance(session_kwargs["connector"], aiohttp.TCPConnector)
+    # The total limit never drops below the aiohttp default
+    assert session_kwargs["connector"].limit == 100
+    assert session_kwargs["connector"].limit_per_host == 5
+    assert session_kwargs["connector_owner"] is False
+
+    _get_filesystem(mocker.MagicMock(), 200, 1)
+
+    session_kwargs = gcsfs.GCSFileSystem.call_args[1]["session_kwargs"]
+    assert session_kwargs["connector"].limit == 200
+    assert session_kwargs["connector"].limit_per_host == 200
+
+
+def test_close_connector_only_closes_connectors_of_current_process():
+    """Tests that the connectors of shared filesystems are closed, except for
+    copies inherited from a parent process."""
+    pid = os.getpid()
+    loop = _get_event_loop(pid)
+    connector = sync(loop, _create_connector, 5)
+
+    _close_connector(loop, connector, pid + 1)
+    assert not connector.closed
+
+    _close_connector(loop, connector, pid)
+    assert connector.closed
+
+
+def test_request_concurrency_limits_concurrent_lookups(mocker):
+    """Tests that concurrent lookups never have more than
+    `request_concurrency` requests in flight."""
+    artifact_store = GCPArtifactStore(
+        name="", path="gs://mybucket", request_concurrency=3
+    )
+    mocker.patch.object(
+        GCPArtifactStore,
+        "filesystem",
+        new_callable=mocker.PropertyMock,
+        return_value=mocker.MagicMock(loop=get_loop()),
+    )
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _lookup(path):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return path
+
+    paths = [f"gs://mybucket/file_{i}" for i in range(10)]
+    assert artifact_store._run_concurrently(_lookup, paths) == {
+        path: path for path in paths
+    }
+    assert max_in_flight == 3
+
+
+def test_local_cache_downloads_each_generation_once(mocker, tmp_path):
+    """Tests that files opened for reading are downloaded into the local cache
+    only once per object generation."""
+    artifact_store = GCPArtifactStore(
+        name="",
+        path="gs://mybucket",
+        use_local_cache=True,
+        local_cache_dir=str(tmp_path),
+    )
+
+    def _download(filename):
+        with open(filename, "wb") as f:
+            f.write(b"content")
+
+    blob = mocker.MagicMock(generation=1)
+    blob.download_to_filename.side_effect = _download
+    client = mocker.MagicMock()
+    client.bucket.return_value.get_blob.return_value = blob
+    artifact_store._client = client
+
+    for _ in range(2):
+        with artifact_store.open("gs://mybucket/file", mode="rb") as f:
+            assert f.read() == b"content"
+    assert blob.download_to_filename.call_count == 1
+
+    blob.generation = 2
+    with artifact_store.open("gs://mybucket/file", mode="rb") as f:
+        assert f.read() == b"content"
+    assert blob.download_to_filename.call_count == 2
+    # The copy of the superseded generation is removed from the cache
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_exists_many_checks_paths_concurrently(mocker):
+    """Tests that existence checks for many paths are sent concurrently and
+    inaccessible paths are reported as missing."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _exists(path):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if path.startswith("gs://missing_bucket"):
+            raise FileNotFoundError(path)
+        return path.endswith(("file", "dir"))
+
+    filesystem = mocker.MagicMock(loop=get_loop(), _exists=_exists)
+    mocker.patch.object(
+        GCPArtifactStore,
+        "filesystem",
+        new_callable=mocker.PropertyMock,
+        return_value=filesystem,
+    )
+
+    paths = [f"gs://mybucket/missing_{i}" for i in range(50)] + [
+        "gs://mybucket/file",
+        b"gs://mybucket/dir",
+        "gs://missing_bucket/file",
+    ]
+    results = artifact_store.exists_many(paths)
+
+    assert max_in_flight == 50 + 3
+    assert results["gs://mybucket/file"]
+    assert results[b"gs://mybucket/dir"]
+    assert not results["gs://missing_bucket/file"]
+    assert not any(results[f"gs://mybucket/missing_{i}"] for i in range(50))
+
+
+def test_isdir_many_and_stat_many_convert_paths(mocker):
+    """Tests that concurrent directory checks and stat calls pass string
+    paths to gcsfs and return results keyed by the original paths."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    async def _isdir(path):
+        assert isinstance(path, str)
+        return path.endswith("dir")
+
+    async def _info(path):
+        assert isinstance(path, str)
+        return {"name": path}
+
+    filesystem = mocker.MagicMock(loop=get_loop(), _isdir=_isdir, _info=_info)
+    mocker.patch.object(
+        GCPArtifactStore,
+        "filesystem",
+        new_callable=mocker.PropertyMock,
+        return_value=filesystem,
+    )
+
+    paths = [b"gs://mybucket/dir", "gs://mybucket/file"]
+    assert artifact_store.isdir_many(paths) == {
+        b"gs://mybucket/dir": True,
+        "gs://mybucket/file": False,
+    }
+    assert artifact_store.stat_many(paths) == {
+        b"gs://mybucket/dir": {"name": "gs://mybucket/dir"},
+        "gs://mybucket/file": {"name": "gs://mybucket/file"},
+    }
+
+
+def test_walk_uses_single_listing(mocker):
+    """Tests that walking a directory tree lists all objects once and
+    rebuilds the tree in the requested order."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    client = mocker.MagicMock()
+    client.list_blobs.side_effect = lambda bucket, prefix: iter(
+        SimpleNamespace(name=name)
+        for name in ["dir/a", "dir/sub/b", "dir/sub/deep/c", "dir/empty/"]
+    )
+    artifact_store._client = client
+
+    assert list(artifact_store.walk("gs://mybucket/dir")) == [
+        ("gs://mybucket/dir", ["empty", "sub"], ["a"]),
+        ("gs://mybucket/dir/empty", [], []),
+        ("gs://mybucket/dir/sub", ["deep"], ["b"]),
+        ("gs://mybucket/dir/sub/deep", [], ["c"]),
+    ]
+    assert list(artifact_store.walk("gs://mybucket/dir", topdown=False)) == [
+        ("gs://mybucket/dir/empty", [], []),
+        ("gs://mybucket/dir/sub/deep", [], ["c"]),
+        ("gs://mybucket/dir/sub", ["deep"], ["b"]),
+        ("gs://mybucket/dir", ["empty", "sub"], ["a"]),
+    ]
+    client.list_blobs.assert_called_with("mybucket", prefix="dir/")
+
+
+def _mock_copy_client(mocker):
+    """Creates a mock client with distinct source and destination blobs."""
+    blobs = {"src": mocker.MagicMock(), "dst": mocker.MagicMock()}
+    blobs["dst"].rewrite.return_value = (None, 0, 0)
+    client = mocker.MagicMock()
+    client.bucket.return_value.blob.side_effect = blobs.__getitem__
+    return client, blobs["src"], blobs["dst"]
+
+
+def test_copyfile_without_overwrite_uses_precondition(mocker):
+    """Tests that copying without overwrite relies on a generation
+    precondition instead of a separate existence check."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+    mocker.patch.object(
+        GCPArtifactStore, "filesystem", new_callable=mocker.PropertyMock
+    )
+    client, src_blob, dst_blob = _mock_copy_client(mocker)
+    artifact_store._client = client
+
+    artifact_store.copyfile("gs://mybucket/src", "gs://mybucket/dst")
+    dst_blob.rewrite.assert_called_once_with(src_blob, if_generation_match=0)
+    dst_blob.reload.assert_not_called()
+
+    dst_blob.rewrite.side_effect = PreconditionFailed("exists")
+    with pytest.raises(FileExistsError):
+        artifact_store.copyfile("gs://mybucket/src", "gs://mybucket/dst")
+
+
+def test_rename_deletes_source_only_after_copying(mocker):
+    """Tests that renaming deletes the source after a successful copy and
+    keeps it if the destination already exists."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+    mocker.patch.object(
+        GCPArtifactStore, "filesystem", new_callable=mocker.PropertyMock
+    )
+    client, src_blob, dst_blob = _mock_copy_client(mocker)
+    artifact_store._client = client
+
+    dst_blob.rewrite.side_effect = PreconditionFailed("exists")
+    with pytest.raises(FileExistsError):
+        artifact_store.rename("gs://mybucket/src", "gs://mybucket/dst")
+    src_blob.delete.assert_not_called()
+
+    dst_blob.rewrite.side_effect = None
+    artifact_store.rename("gs://mybucket/src", "gs://mybucket/dst")
+    dst_blob.rewrite.assert_called_with(src_blob, if_generation_match=0)
+    src_blob.delete.assert_called_once_with()
+
+
+def test_glob_lists_single_levels_unless_recursive(mocker):
+    """Tests that non-recursive glob patterns are matched using delimited
+    listings of single directory levels while recursive patterns are matched
+    against a single listing of all objects below the static prefix."""
+    artifact_store = GCPArtifactStore(name="", path="gs://mybucket")
+
+    object_names = ["dir/a.txt", "dir/sub/b.txt", "dir/sub/deep/c.json"]
+
+    def _list_blobs(bucket, prefix, delimiter=None):
+        names = [name for name in object_names if name.startswith(prefix)]
+        iterator = mocker.MagicMock()
+        iterator.prefixes = set()
+        if delimiter:
+            directory = prefix[: prefix.rfind("/") + 1]
+            for name in list(names):
+                if "/" in name[len(directory) :]:
+                    names.remove(name)
+                    subdirectory = name[len(directory) :].split("/")[0]
+                    iterator.prefixes.add(f"{directory}{subdirectory}/")
+        iterator.__iter__.return_value = iter(
+            SimpleNamespace(name=name) for name in names
+        )
+        return iterator
+
+    client = mocker.MagicMock()
+    client.list_blobs.side_effect = _list_blobs
+    artifact_store._client = client
+
+    assert artifact_store.glob("gs://mybucket/dir/*") == [
+        "gs://mybucket/dir/a.txt",
+        "gs://mybucket/dir/sub",
+    ]
+    client.list_blobs.assert_called_once_with(
+        "mybucket", prefix="dir/", delimiter="/"
+    )
+
+    client.list_blobs.reset_mock()
+    assert artifact_store.glob("gs://mybucket/dir/**/*.txt") == [
+        "gs://mybucket/dir/a.txt",
+        "gs://mybucket/dir/sub/b.txt",
+    ]
+    client.list_blobs.assert_called_once_with("mybucket", prefix="dir/")
+
+    assert artifact_store.glob("gs://mybucket/d?r/sub/deep/[abc].json") == [
+        "gs://mybucket/dir/sub/deep/c.json"
+    ]
+    assert artifact_store.glob("gs://mybucket/dir/*/*.txt") == [
+        "gs://mybucket/dir/sub/b.txt"
+    ]